@@ -17,11 +17,9 @@ Date: February 2026
 """
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 from typing import Dict, Optional, List
 import math
-from io import BytesIO
 import random
 
 # =============================================================================
@@ -166,6 +164,7 @@ TEST_PARAMETERS = {
 
 BASE_KIT_COST = 9.50
 BASE_KIT_WEIGHT = 1.5
+BOTTLES_PER_PACKAGE = 2
 ASSEMBLY_TIME = 7
 
 STEP_NAMES = [
@@ -176,6 +175,14 @@ STEP_NAMES = [
     "Pick List"
 ]
 
+PRICE_CARD_TEMPLATE = """
+    <div class="price-display" style="margin-top: 1.5rem;">
+        <div class="price-label">Total Price</div>
+        <div class="price-amount">${total:.2f}</div>
+        <div class="price-sub">Base: ${base_price:.2f} + Shipping: ${ship_cost:.2f}</div>
+    </div>
+    """
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -207,31 +214,18 @@ def calc_custom_order(tests: List[str]) -> Dict:
     sharing = 'general_chemistry' in tests and 'anions' in tests
     has_pfas = 'pfas' in tests
     
-    bottles = 0
-    for t in tests:
-        if t == 'general_chemistry':
-            bottles += 1
-        elif t == 'metals':
-            bottles += 1
-        elif t == 'anions' and not sharing:
-            bottles += 1
-        elif t == 'nutrients':
-            bottles += 1
-        elif t == 'pfas':
-            bottles += 2
-    
-    packages = max(1, math.ceil(bottles / 2))
-    
-    weight = BASE_KIT_WEIGHT * packages
-    cost = BASE_KIT_COST * packages
-    
-    for t in tests:
-        if t in TEST_PARAMETERS:
-            weight += TEST_PARAMETERS[t]['weight']
-            if t == 'anions' and sharing:
-                cost += TEST_PARAMETERS[t].get('cost_when_shared', 0)
-            else:
-                cost += TEST_PARAMETERS[t]['cost']
+    params = [TEST_PARAMETERS[t] for t in tests if t in TEST_PARAMETERS]
+    
+    # Anions ride along in the Gen Chem bottle when both are selected
+    bottles = sum(p.get('bottle_qty', 1) for p in params) - (1 if sharing else 0)
+    
+    packages = max(1, math.ceil(bottles / BOTTLES_PER_PACKAGE))
+    
+    weight = BASE_KIT_WEIGHT * packages + sum(p['weight'] for p in params)
+    cost = BASE_KIT_COST * packages + sum(p['cost'] for p in params)
+    if sharing:
+        anions = TEST_PARAMETERS['anions']
+        cost -= anions['cost'] - anions.get('cost_when_shared', 0)
     
     return {
         'bottles': bottles,
@@ -247,6 +241,43 @@ def estimate_shipping(compliance: bool, packages: int) -> float:
     return (50.0 if compliance else 12.0) * packages
 
 
+def calc_order_pricing(order_mode: str, bundle_sku: Optional[str], tests: List[str], compliance: bool) -> Dict:
+    """Price an order: base price, packages, PFAS flag and shipping"""
+    info = None
+    if order_mode == 'bundle':
+        base_price = BUNDLE_CATALOG[bundle_sku]['price']
+        packages = get_bundle_kits(bundle_sku)
+        has_pfas = bundle_has_pfas(bundle_sku)
+    else:
+        info = calc_custom_order(tests)
+        base_price = info['cost']
+        packages = info['packages']
+        has_pfas = info['has_pfas']
+    
+    ship_cost = estimate_shipping(compliance, packages)
+    
+    return {
+        'base_price': base_price,
+        'packages': packages,
+        'has_pfas': has_pfas,
+        'ship_cost': ship_cost,
+        'total': base_price + ship_cost,
+        'custom_info': info
+    }
+
+
+def render_shipping_estimate(packages: int, ship_est: float) -> str:
+    """HTML for the Step 2 shipping estimate"""
+    return f"""
+    <div style="background: #F5F8FA; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
+        <div style="display: flex; justify-content: space-between;">
+            <span>Estimated Shipping ({packages} package{'s' if packages > 1 else ''}):</span>
+            <span style="font-weight: 600;">${ship_est:.2f}</span>
+        </div>
+    </div>
+    """
+
+
 # =============================================================================
 # PICK LIST GENERATION
 # =============================================================================
@@ -403,7 +434,7 @@ def format_professional_picklist(pl: Dict) -> str:
     else:
         lines.append(bordered("  • Assemble all components as listed above"))
         if pl['packages'] > 1:
-            lines.append(bordered(f"  • Split into {pl['packages']} packages (max 2 bottles/box)"))
+            lines.append(bordered(f"  • Split into {pl['packages']} packages (max {BOTTLES_PER_PACKAGE} bottles/box)"))
         if pl['has_pfas']:
             lines.append(bordered("  • ⚠ PFAS order - PFAS-free gloves & packaging only"))
         if pl.get('sharing'):
@@ -592,7 +623,7 @@ def generate_pdf(pl: Dict) -> Optional[bytes]:
         else:
             pdf.cell(0, 6, '  * Assemble all components as listed above', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
             if pl['packages'] > 1:
-                pdf.cell(0, 6, f"  * Split into {pl['packages']} packages (max 2 bottles per box)", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+                pdf.cell(0, 6, f"  * Split into {pl['packages']} packages (max {BOTTLES_PER_PACKAGE} bottles per box)", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
             if pl['has_pfas']:
                 pdf.set_font('Helvetica', 'B', 10)
                 pdf.set_text_color(180, 0, 0)
@@ -645,7 +676,7 @@ def generate_pdf(pl: Dict) -> Optional[bytes]:
 # CUSTOM CSS
 # =============================================================================
 
-st.markdown("""
+APP_CSS = """
 <style>
     /* Hide default streamlit elements */
     #MainMenu {visibility: hidden;}
@@ -780,22 +811,6 @@ st.markdown("""
     .price-amount { font-size: 3rem; font-weight: 700; }
     .price-sub { font-size: 0.9rem; opacity: 0.8; }
     
-    /* Pick list */
-    .picklist-box {
-        background: #FAFAFA;
-        border: 1px solid #E0E0E0;
-        border-radius: 8px;
-        padding: 1rem;
-        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-        font-size: 11px;
-        line-height: 1.5;
-        white-space: pre;
-        overflow-x: auto;
-        overflow-y: auto;
-        max-height: 600px;
-        min-width: 100%;
-    }
-    
     /* Navigation buttons */
     .nav-container {
         display: flex;
@@ -829,40 +844,47 @@ st.markdown("""
     .success-title { font-size: 1.5rem; font-weight: 600; color: #00A86B; }
     .success-order { font-size: 1.25rem; color: #333; margin-top: 0.5rem; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# st.html injects the <style> tag directly, skipping the Markdown parser
+# that st.markdown would run it through on every rerun
+st.html(APP_CSS)
 
 
 # =============================================================================
 # SESSION STATE
 # =============================================================================
 
-if 'current_step' not in st.session_state:
-    st.session_state.current_step = 0
-if 'order_mode' not in st.session_state:
-    st.session_state.order_mode = None
-if 'selected_bundle' not in st.session_state:
-    st.session_state.selected_bundle = None
-if 'selected_tests' not in st.session_state:
-    st.session_state.selected_tests = {}
-if 'compliance' not in st.session_state:
-    st.session_state.compliance = False
-if 'order_number' not in st.session_state:
-    st.session_state.order_number = None
-if 'pick_list' not in st.session_state:
-    st.session_state.pick_list = None
-if 'order_complete' not in st.session_state:
-    st.session_state.order_complete = False
+def session_defaults() -> Dict:
+    """Initial wizard state, built fresh so mutable values are never shared"""
+    return {
+        'current_step': 0,
+        'order_mode': None,
+        'selected_bundle': None,
+        'selected_tests': set(),
+        'compliance': False,
+        'order_number': None,
+        'pick_list': None,
+        'order_complete': False,
+        'pricing_key': None,
+        'pricing': None,
+        'picklist_order': None,
+        'picklist_text': None,
+        'picklist_pdf': None
+    }
+
+
+def init_session_state():
+    """Fill in any wizard state this session does not have yet"""
+    for key, value in session_defaults().items():
+        st.session_state.setdefault(key, value)
+
+
+init_session_state()
 
 
 def reset_wizard():
-    st.session_state.current_step = 0
-    st.session_state.order_mode = None
-    st.session_state.selected_bundle = None
-    st.session_state.selected_tests = {}
-    st.session_state.compliance = False
-    st.session_state.order_number = None
-    st.session_state.pick_list = None
-    st.session_state.order_complete = False
+    st.session_state.update(session_defaults())
 
 
 def go_next():
@@ -873,6 +895,54 @@ def go_back():
     st.session_state.current_step -= 1
 
 
+def set_order_mode(mode: str):
+    """Order type button callback"""
+    st.session_state.order_mode = mode
+
+
+def select_bundle(sku: str):
+    """Bundle button callback"""
+    st.session_state.selected_bundle = sku
+
+
+def toggle_test(key: str):
+    """Checkbox callback keeping selected_tests in sync with test_<key>"""
+    if st.session_state[f"test_{key}"]:
+        st.session_state.selected_tests.add(key)
+    else:
+        st.session_state.selected_tests.discard(key)
+
+
+def set_compliance():
+    """Checkbox callback copying compliance_check into compliance"""
+    st.session_state.compliance = st.session_state.compliance_check
+
+
+def get_selected_tests() -> List[str]:
+    """Selected test keys in TEST_PARAMETERS order"""
+    return [k for k in TEST_PARAMETERS if k in st.session_state.selected_tests]
+
+
+def get_order_pricing() -> Dict:
+    """Price the current order, reusing the last result while its inputs are unchanged"""
+    tests = get_selected_tests()
+    pricing_key = (
+        st.session_state.order_mode,
+        st.session_state.selected_bundle,
+        tuple(tests),
+        st.session_state.compliance
+    )
+    if st.session_state.pricing_key != pricing_key:
+        st.session_state.pricing = calc_order_pricing(
+            st.session_state.order_mode,
+            st.session_state.selected_bundle,
+            tests,
+            st.session_state.compliance
+        )
+        st.session_state.pricing_key = pricing_key
+    return st.session_state.pricing
+
+
 # =============================================================================
 # STEP INDICATOR
 # =============================================================================
@@ -922,9 +992,10 @@ with col2:
     """, unsafe_allow_html=True)
 
 with col3:
+    # Everything that reads the wizard state renders below this button, so
+    # the reset takes effect in this run without forcing a second one
     if st.button("🔄 Start Over", key="reset_top"):
         reset_wizard()
-        st.rerun()
 
 st.divider()
 
@@ -937,45 +1008,48 @@ render_step_indicator()
 # =============================================================================
 
 if st.session_state.current_step == 0:
-    st.markdown('<div class="card"><div class="card-header">Select Order Type</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        bundle_selected = st.session_state.order_mode == 'bundle'
-        if st.button(
-            "📦 Pre-Packed Bundle\n\nSelect from 10 pre-configured packages",
-            key="btn_bundle",
-            type="primary" if bundle_selected else "secondary",
-            use_container_width=True
-        ):
-            st.session_state.order_mode = 'bundle'
-            st.rerun()
-    
-    with col2:
-        custom_selected = st.session_state.order_mode == 'custom'
-        if st.button(
-            "🔧 Custom Order\n\nBuild your own test combination",
-            key="btn_custom",
-            type="primary" if custom_selected else "secondary",
-            use_container_width=True
-        ):
-            st.session_state.order_mode = 'custom'
-            st.rerun()
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Each step renders as a fragment: its own widgets rerun only that step,
+    # while Back/Next use a full st.rerun() to move the step indicator
+    @st.fragment
+    def render_order_type_step():
+        st.markdown('<div class="card"><div class="card-header">Select Order Type</div></div>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            bundle_selected = st.session_state.order_mode == 'bundle'
+            st.button(
+                "📦 Pre-Packed Bundle\n\nSelect from 10 pre-configured packages",
+                key="btn_bundle",
+                type="primary" if bundle_selected else "secondary",
+                use_container_width=True,
+                on_click=set_order_mode,
+                args=('bundle',)
+            )
+        
+        with col2:
+            custom_selected = st.session_state.order_mode == 'custom'
+            st.button(
+                "🔧 Custom Order\n\nBuild your own test combination",
+                key="btn_custom",
+                type="primary" if custom_selected else "secondary",
+                use_container_width=True,
+                on_click=set_order_mode,
+                args=('custom',)
+            )
+        
+        # Navigation
+        st.markdown('<div class="nav-container"></div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col3:
+            if st.session_state.order_mode:
+                if st.button("Next →", key="next_0", type="primary", use_container_width=True):
+                    go_next()
+                    st.rerun()
+            else:
+                st.button("Next →", key="next_0_disabled", disabled=True, use_container_width=True)
     
-    # Navigation
-    st.markdown('<div class="nav-container">', unsafe_allow_html=True)
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col3:
-        if st.session_state.order_mode:
-            if st.button("Next →", key="next_0", type="primary", use_container_width=True):
-                go_next()
-                st.rerun()
-        else:
-            st.button("Next →", key="next_0_disabled", disabled=True, use_container_width=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    render_order_type_step()
 
 
 # =============================================================================
@@ -983,102 +1057,101 @@ if st.session_state.current_step == 0:
 # =============================================================================
 
 elif st.session_state.current_step == 1:
-    
-    if st.session_state.order_mode == 'bundle':
-        st.markdown('<div class="card"><div class="card-header">Select Bundle</div>', unsafe_allow_html=True)
-        
-        # Group bundles
-        groups = {}
-        for sku, data in BUNDLE_CATALOG.items():
-            t = data['type']
-            if t not in groups:
-                groups[t] = []
-            groups[t].append((sku, data))
-        
-        for group_name, bundles in groups.items():
-            st.subheader(group_name)
+    @st.fragment
+    def render_selection_step():
+        if st.session_state.order_mode == 'bundle':
+            st.markdown('<div class="card"><div class="card-header">Select Bundle</div></div>', unsafe_allow_html=True)
             
-            cols = st.columns(3)
-            for i, (sku, data) in enumerate(bundles):
-                with cols[i % 3]:
-                    selected = st.session_state.selected_bundle == sku
-                    has_pfas = '1300-00003_REV01' in data['kits']
-                    kits = sum(data['kits'].values())
-                    
-                    # Card content
-                    pfas_badge = "⚠️ PFAS" if has_pfas else ""
-                    btn_label = f"{'✅ ' if selected else ''}{sku}\n{data['name']}\n{kits} kit(s) • ${data['price']:.0f} {pfas_badge}"
-                    
-                    if st.button(btn_label, key=f"bundle_{sku}", 
-                                type="primary" if selected else "secondary",
-                                use_container_width=True):
-                        st.session_state.selected_bundle = sku
-                        st.rerun()
+            selected_bundle = st.session_state.selected_bundle
             
-            st.markdown("")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        can_proceed = st.session_state.selected_bundle is not None
-    
-    else:  # Custom order
-        st.markdown('<div class="card"><div class="card-header">Select Tests</div>', unsafe_allow_html=True)
-        
-        sharing = (st.session_state.selected_tests.get('general_chemistry', False) and 
-                   st.session_state.selected_tests.get('anions', False))
-        
-        for key, data in TEST_PARAMETERS.items():
-            checked = st.session_state.selected_tests.get(key, False)
+            # Group bundles by category, in catalog order
+            groups = {}
+            for sku, data in BUNDLE_CATALOG.items():
+                groups.setdefault(data['type'], []).append((sku, data))
             
-            # Special labels
-            label = data['name']
-            if key == 'pfas':
-                label += " ⚠️"
-            if key == 'anions' and sharing:
-                label += " 🎁 FREE"
+            for group_name, bundles in groups.items():
+                st.subheader(group_name)
+                
+                cols = st.columns(3)
+                for i, (sku, data) in enumerate(bundles):
+                    with cols[i % 3]:
+                        selected = selected_bundle == sku
+                        has_pfas = '1300-00003_REV01' in data['kits']
+                        kits = sum(data['kits'].values())
+                        
+                        # Card content
+                        pfas_badge = "⚠️ PFAS" if has_pfas else ""
+                        btn_label = f"{'✅ ' if selected else ''}{sku}\n{data['name']}\n{kits} kit(s) • ${data['price']:.0f} {pfas_badge}"
+                        
+                        st.button(btn_label, key=f"bundle_{sku}", 
+                                  type="primary" if selected else "secondary",
+                                  use_container_width=True,
+                                  on_click=select_bundle,
+                                  args=(sku,))
+                
+                st.markdown("")
             
-            col1, col2 = st.columns([3, 1])
+            can_proceed = selected_bundle is not None
+        
+        else:  # Custom order
+            st.markdown('<div class="card"><div class="card-header">Select Tests</div></div>', unsafe_allow_html=True)
             
-            with col1:
-                new_val = st.checkbox(
-                    label,
-                    value=checked,
-                    key=f"test_{key}"
-                )
-                st.session_state.selected_tests[key] = new_val
-                
-                # Show details
-                if new_val:
-                    if key == 'anions' and sharing:
-                        st.success("✅ Shares bottle with General Chemistry - FREE!")
-                    if key == 'pfas':
-                        st.warning("⚠️ Requires PFAS-free handling")
+            selected_tests = st.session_state.selected_tests
+            sharing = 'general_chemistry' in selected_tests and 'anions' in selected_tests
             
-            with col2:
+            for key, data in TEST_PARAMETERS.items():
+                checked = key in selected_tests
+                
+                # Special labels
+                label = data['name']
+                if key == 'pfas':
+                    label += " ⚠️"
                 if key == 'anions' and sharing:
-                    st.markdown("**$0.00**")
-                else:
-                    st.markdown(f"**${data['cost']:.2f}**")
+                    label += " 🎁 FREE"
+                
+                col1, col2 = st.columns([3, 1])
+                
+                with col1:
+                    new_val = st.checkbox(
+                        label,
+                        value=checked,
+                        key=f"test_{key}",
+                        on_change=toggle_test,
+                        args=(key,)
+                    )
+                    
+                    # Show details
+                    if new_val:
+                        if key == 'anions' and sharing:
+                            st.success("✅ Shares bottle with General Chemistry - FREE!")
+                        if key == 'pfas':
+                            st.warning("⚠️ Requires PFAS-free handling")
+                
+                with col2:
+                    if key == 'anions' and sharing:
+                        st.markdown("**$0.00**")
+                    else:
+                        st.markdown(f"**${data['cost']:.2f}**")
+                
+                st.markdown("---")
             
-            st.markdown("---")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+            can_proceed = bool(selected_tests)
         
-        can_proceed = any(st.session_state.selected_tests.values())
-    
-    # Navigation
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col1:
-        if st.button("← Back", key="back_1", use_container_width=True):
-            go_back()
-            st.rerun()
-    with col3:
-        if can_proceed:
-            if st.button("Next →", key="next_1", type="primary", use_container_width=True):
-                go_next()
+        # Navigation
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("← Back", key="back_1", use_container_width=True):
+                go_back()
                 st.rerun()
-        else:
-            st.button("Next →", key="next_1_disabled", disabled=True, use_container_width=True)
+        with col3:
+            if can_proceed:
+                if st.button("Next →", key="next_1", type="primary", use_container_width=True):
+                    go_next()
+                    st.rerun()
+            else:
+                st.button("Next →", key="next_1_disabled", disabled=True, use_container_width=True)
+    
+    render_selection_step()
 
 
 # =============================================================================
@@ -1086,50 +1159,41 @@ elif st.session_state.current_step == 1:
 # =============================================================================
 
 elif st.session_state.current_step == 2:
-    st.markdown('<div class="card"><div class="card-header">Shipping Options</div>', unsafe_allow_html=True)
-    
-    st.session_state.compliance = st.checkbox(
-        "**Compliance Shipping** (FedEx 2-Day Priority)",
-        value=st.session_state.compliance,
-        key="compliance_check"
-    )
-    
-    if st.session_state.compliance:
-        st.info("📦 FedEx 2-Day shipping for time-sensitive samples")
-    else:
-        st.info("📦 Standard FedEx Ground shipping (3-5 business days)")
-    
-    # Calculate and show estimate
-    if st.session_state.order_mode == 'bundle':
-        packages = get_bundle_kits(st.session_state.selected_bundle)
-    else:
-        tests = [k for k, v in st.session_state.selected_tests.items() if v]
-        info = calc_custom_order(tests)
-        packages = info['packages']
-    
-    ship_est = estimate_shipping(st.session_state.compliance, packages)
-    
-    st.markdown(f"""
-    <div style="background: #F5F8FA; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
-        <div style="display: flex; justify-content: space-between;">
-            <span>Estimated Shipping ({packages} package{'s' if packages > 1 else ''}):</span>
-            <span style="font-weight: 600;">${ship_est:.2f}</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+    @st.fragment
+    def render_shipping_step():
+        st.markdown('<div class="card"><div class="card-header">Shipping Options</div></div>', unsafe_allow_html=True)
+        
+        st.checkbox(
+            "**Compliance Shipping** (FedEx 2-Day Priority)",
+            value=st.session_state.compliance,
+            key="compliance_check",
+            on_change=set_compliance
+        )
+        
+        if st.session_state.compliance:
+            st.info("📦 FedEx 2-Day shipping for time-sensitive samples")
+        else:
+            st.info("📦 Standard FedEx Ground shipping (3-5 business days)")
+        
+        # Calculate and show estimate
+        pricing = get_order_pricing()
+        packages = pricing['packages']
+        ship_est = pricing['ship_cost']
+        
+        st.markdown(render_shipping_estimate(packages, ship_est), unsafe_allow_html=True)
+        
+        # Navigation
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("← Back", key="back_2", use_container_width=True):
+                go_back()
+                st.rerun()
+        with col3:
+            if st.button("Next →", key="next_2", type="primary", use_container_width=True):
+                go_next()
+                st.rerun()
     
-    # Navigation
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col1:
-        if st.button("← Back", key="back_2", use_container_width=True):
-            go_back()
-            st.rerun()
-    with col3:
-        if st.button("Next →", key="next_2", type="primary", use_container_width=True):
-            go_next()
-            st.rerun()
+    render_shipping_step()
 
 
 # =============================================================================
@@ -1137,69 +1201,83 @@ elif st.session_state.current_step == 2:
 # =============================================================================
 
 elif st.session_state.current_step == 3:
-    st.markdown('<div class="card"><div class="card-header">Review Order</div>', unsafe_allow_html=True)
-    
-    # Calculate totals
-    if st.session_state.order_mode == 'bundle':
-        bundle = BUNDLE_CATALOG[st.session_state.selected_bundle]
-        base_price = bundle['price']
-        packages = get_bundle_kits(st.session_state.selected_bundle)
-        has_pfas = bundle_has_pfas(st.session_state.selected_bundle)
+    @st.fragment
+    def render_review_step():
+        # Calculate totals
+        tests = get_selected_tests()
+        pricing = get_order_pricing()
         
-        st.markdown(f"**Order Type:** Pre-Packed Bundle")
-        st.markdown(f"**Bundle:** {st.session_state.selected_bundle} - {bundle['name']}")
-        st.markdown(f"**Category:** {bundle['type']}")
-        st.markdown(f"**Total Kits:** {packages}")
+        base_price = pricing['base_price']
+        packages = pricing['packages']
+        has_pfas = pricing['has_pfas']
+        ship_cost = pricing['ship_cost']
+        total = pricing['total']
         
-    else:
-        tests = [k for k, v in st.session_state.selected_tests.items() if v]
-        info = calc_custom_order(tests)
-        base_price = info['cost']
-        packages = info['packages']
-        has_pfas = info['has_pfas']
+        if st.session_state.order_mode == 'bundle':
+            bundle = BUNDLE_CATALOG[st.session_state.selected_bundle]
+            
+            review_rows = [
+                ("Order Type", "Pre-Packed Bundle"),
+                ("Bundle", f"{st.session_state.selected_bundle} - {bundle['name']}"),
+                ("Category", bundle['type']),
+                ("Total Kits", packages)
+            ]
+            
+        else:
+            info = pricing['custom_info']
+            
+            test_names = [TEST_PARAMETERS[t]['name'] for t in tests]
+            review_rows = [
+                ("Order Type", "Custom Order"),
+                ("Tests", ', '.join(test_names)),
+                ("Bottles", info['bottles']),
+                ("Packages", packages)
+            ]
+            if info['sharing']:
+                review_rows.append(("Bottle Sharing", "Yes (Gen Chem + Anions)"))
         
-        test_names = [TEST_PARAMETERS[t]['name'] for t in tests]
-        st.markdown(f"**Order Type:** Custom Order")
-        st.markdown(f"**Tests:** {', '.join(test_names)}")
-        st.markdown(f"**Bottles:** {info['bottles']}")
-        st.markdown(f"**Packages:** {packages}")
-        if info['sharing']:
-            st.markdown("**Bottle Sharing:** Yes (Gen Chem + Anions)")
-    
-    st.markdown(f"**PFAS Included:** {'Yes ⚠️' if has_pfas else 'No'}")
-    st.markdown(f"**Shipping:** {'Compliance (2-Day)' if st.session_state.compliance else 'Standard Ground'}")
-    
-    ship_cost = estimate_shipping(st.session_state.compliance, packages)
-    total = base_price + ship_cost
-    
-    st.markdown(f"""
-    <div class="price-display" style="margin-top: 1.5rem;">
-        <div class="price-label">Total Price</div>
-        <div class="price-amount">${total:.2f}</div>
-        <div class="price-sub">Base: ${base_price:.2f} + Shipping: ${ship_cost:.2f}</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Confirmation
-    st.markdown('<div class="card"><div class="card-header">Confirm & Generate Pick List</div>', unsafe_allow_html=True)
-    
-    st.markdown("Please review the order details above. Click **Confirm & Generate** to create the pick list.")
-    
-    confirmed = st.checkbox("I confirm this order is correct", key="confirm_order")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Navigation
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col1:
-        if st.button("← Back", key="back_3", use_container_width=True):
+        review_rows.append(("PFAS Included", 'Yes ⚠️' if has_pfas else 'No'))
+        review_rows.append(("Shipping", 'Compliance (2-Day)' if st.session_state.compliance else 'Standard Ground'))
+        
+        # Emit the whole review card as a single element
+        html_parts = ['<div class="card"><div class="card-header">Review Order</div>']
+        for label, value in review_rows:
+            html_parts.append(
+                f'<div class="review-item"><span class="review-label">{label}</span>'
+                f'<span class="review-value">{value}</span></div>'
+            )
+        html_parts.append(PRICE_CARD_TEMPLATE.format(
+            total=total, base_price=base_price, ship_cost=ship_cost
+        ))
+        html_parts.append('</div>')
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
+        
+        # Confirmation
+        st.markdown("""
+        <div class="card">
+            <div class="card-header">Confirm & Generate Pick List</div>
+            Please review the order details above. Click <strong>Confirm & Generate</strong> to create the pick list.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # The checkbox lives in a form so ticking it does not trigger a rerun;
+        # only the navigation buttons do
+        with st.form("confirm_order_form", border=False):
+            confirmed = st.checkbox("I confirm this order is correct", key="confirm_order")
+            
+            # Navigation
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                back = st.form_submit_button("← Back", use_container_width=True)
+            with col3:
+                submitted = st.form_submit_button("Confirm & Generate →", type="primary", use_container_width=True)
+        
+        if back:
             go_back()
             st.rerun()
-    with col3:
-        if confirmed:
-            if st.button("Confirm & Generate →", key="next_3", type="primary", use_container_width=True):
+        
+        if submitted:
+            if confirmed:
                 # Generate order number
                 st.session_state.order_number = generate_order_number()
                 
@@ -1210,16 +1288,16 @@ elif st.session_state.current_step == 3:
                         st.session_state.order_number
                     )
                 else:
-                    tests = [k for k, v in st.session_state.selected_tests.items() if v]
-                    info = calc_custom_order(tests)
                     st.session_state.pick_list = create_custom_picklist(
-                        tests, info, st.session_state.order_number
+                        tests, pricing['custom_info'], st.session_state.order_number
                     )
                 
                 go_next()
                 st.rerun()
-        else:
-            st.button("Confirm & Generate →", key="next_3_disabled", disabled=True, use_container_width=True)
+            else:
+                st.warning("Please confirm the order is correct before generating the pick list.")
+    
+    render_review_step()
 
 
 # =============================================================================
@@ -1227,73 +1305,80 @@ elif st.session_state.current_step == 3:
 # =============================================================================
 
 elif st.session_state.current_step == 4:
-    pl = st.session_state.pick_list
-    
-    # Success message
-    st.markdown(f"""
-    <div class="success-box">
-        <div class="success-icon">✅</div>
-        <div class="success-title">Pick List Generated Successfully!</div>
-        <div class="success-order">{pl['order_number']}</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("")
-    
-    # Pick List Display
-    st.markdown('<div class="card"><div class="card-header">Pick List</div>', unsafe_allow_html=True)
-    
-    text = format_professional_picklist(pl)
-    st.markdown(f'<div class="picklist-box">{text}</div>', unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Downloads
-    st.markdown('<div class="card"><div class="card-header">Download</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.download_button(
-            "📥 Download TXT",
-            data=text,
-            file_name=f"{pl['order_number']}_PickList.txt",
-            mime="text/plain",
-            use_container_width=True
-        )
-    
-    with col2:
-        pdf_bytes = generate_pdf(pl)
-        if pdf_bytes:
+    @st.fragment
+    def render_picklist_step():
+        pl = st.session_state.pick_list
+        
+        # Render the text and PDF once per order; download clicks rerun this
+        # step and would otherwise rebuild both every time
+        if st.session_state.picklist_order != pl['order_number']:
+            st.session_state.picklist_text = format_professional_picklist(pl)
+            st.session_state.picklist_pdf = generate_pdf(pl)
+            st.session_state.picklist_order = pl['order_number']
+        
+        # Success message and pick list card header, emitted as one element
+        st.markdown(f"""
+        <div class="success-box" style="margin-bottom: 1.5rem;">
+            <div class="success-icon">✅</div>
+            <div class="success-title">Pick List Generated Successfully!</div>
+            <div class="success-order">{pl['order_number']}</div>
+        </div>
+        <div class="card"><div class="card-header">Pick List</div></div>
+        """, unsafe_allow_html=True)
+        
+        # Pick List Display
+        text = st.session_state.picklist_text
+        # Fixed-height scroll box so long pick lists don't push the
+        # downloads and navigation off-screen
+        with st.container(height=600, border=False):
+            st.code(text, language=None)
+        
+        # Downloads
+        st.markdown('<div class="card"><div class="card-header">Download</div></div>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
             st.download_button(
-                "📄 Download PDF",
-                data=pdf_bytes,
-                file_name=f"{pl['order_number']}_PickList.pdf",
-                mime="application/pdf",
+                "📥 Download TXT",
+                data=text,
+                file_name=f"{pl['order_number']}_PickList.txt",
+                mime="text/plain",
                 use_container_width=True
             )
-        else:
-            # Show debug info
-            st.error("PDF generation failed")
-            try:
-                from fpdf import FPDF
-                st.info("✅ fpdf2 is installed")
-                from fpdf.enums import XPos, YPos
-                st.info("✅ fpdf2 enums available")
-            except ImportError as e:
-                st.error(f"❌ fpdf2 import error: {e}")
-            except Exception as e:
-                st.error(f"❌ Unexpected error: {e}")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Navigation
-    st.markdown("")
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("🔄 Start New Order", key="new_order", type="primary", use_container_width=True):
-            reset_wizard()
-            st.rerun()
+        
+        with col2:
+            pdf_bytes = st.session_state.picklist_pdf
+            if pdf_bytes:
+                st.download_button(
+                    "📄 Download PDF",
+                    data=pdf_bytes,
+                    file_name=f"{pl['order_number']}_PickList.pdf",
+                    mime="application/pdf",
+                    use_container_width=True
+                )
+            else:
+                # Show debug info
+                st.error("PDF generation failed")
+                try:
+                    from fpdf import FPDF
+                    st.info("✅ fpdf2 is installed")
+                    from fpdf.enums import XPos, YPos
+                    st.info("✅ fpdf2 enums available")
+                except ImportError as e:
+                    st.error(f"❌ fpdf2 import error: {e}")
+                except Exception as e:
+                    st.error(f"❌ Unexpected error: {e}")
+        
+        # Navigation
+        st.markdown("")
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("🔄 Start New Order", key="new_order", type="primary", use_container_width=True):
+                reset_wizard()
+                st.rerun()
+    
+    render_picklist_step()
 
 
 # =============================================================================